@@ -14,19 +14,15 @@ import asyncio
 import json
 import sys
 from decimal import Decimal
-from pathlib import Path
 
 import structlog
 
-
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from binance.infrastructure.binance_client.http_client import BinanceClient
 from binance.infrastructure.database.repositories.user_repository_impl import (
     UserRepositoryImpl,
 )
 from binance.infrastructure.database.session import get_db
+from binance.infrastructure.event_loop import install_uvloop
 
 
 logger = structlog.get_logger(__name__)
@@ -117,7 +113,10 @@ async def query_single_user(
         target_token: 目标代币符号，如果为None则显示所有代币
 
     Returns:
-        用户结果字典，或 None（如果查询失败）
+        用户结果字典，或 None（用户认证信息无效/未找到代币信息）
+
+    Raises:
+        Exception: 交易量查询失败
     """
     try:
         # 解析 headers（JSON格式）
@@ -144,94 +143,89 @@ async def query_single_user(
         except Exception:
             pass  # 使用原始字符串
 
-    # 查询交易量
-    try:
-        # 使用共享的HTTP客户端进行并行查询
-        volume_data = await get_user_volume_shared(headers, cookies_str)
-        volume_list = volume_data.get("tradeVolumeInfoList", [])
-
-        if target_token:
-            # 查询指定代币
-            token_info = await get_token_info_cached(target_token, headers, cookies_str)
-            if not token_info:
-                print(f"⚠️ 用户{user.id} 未找到代币信息: {target_token}")
-                return None
-
-            mul_point = int(token_info.get("mulPoint", 1) or 1)
-
-            # 从 tradeVolumeInfoList 中查找目标代币
-            for token_vol in volume_list:
-                if token_vol.get("tokenName") == target_token:
-                    displayed_volume = Decimal(str(token_vol.get("volume", 0)))
-                    real_volume = displayed_volume / Decimal(str(mul_point))
-
-                    return {
-                        "user_id": user.id,
-                        "name": user.name,
-                        "token_volumes": {target_token: {
-                            "displayed_volume": displayed_volume,
-                            "real_volume": real_volume,
-                        }},
-                    }
-
-            # 未找到该代币的交易量
-            return {
-                "user_id": user.id,
-                "name": user.name,
-                "token_volumes": {target_token: {
-                    "displayed_volume": Decimal("0"),
-                    "real_volume": Decimal("0"),
-                }},
-            }
-        else:
-            # 查询所有代币
-            token_volumes = {}
-            
-            # 获取所有代币信息（用于mulPoint处理）
-            all_tokens = set()
-            for token_vol in volume_list:
-                token_name = token_vol.get("tokenName")
-                if token_name:
-                    all_tokens.add(token_name)
-            
-            # 批量获取代币信息
-            for token_name in all_tokens:
-                try:
-                    token_info = await get_token_info_cached(token_name, headers, cookies_str)
-                    if token_info:
-                        mul_point = int(token_info.get("mulPoint", 1) or 1)
-                        
-                        # 查找对应的交易量
-                        for token_vol in volume_list:
-                            if token_vol.get("tokenName") == token_name:
-                                displayed_volume = Decimal(str(token_vol.get("volume", 0)))
-                                real_volume = displayed_volume / Decimal(str(mul_point))
-                                
-                                token_volumes[token_name] = {
-                                    "displayed_volume": displayed_volume,
-                                    "real_volume": real_volume,
-                                }
-                                break
-                except Exception:
-                    # 如果获取代币信息失败，使用默认mulPoint=1
+    # 查询交易量：使用共享的HTTP客户端进行并行查询
+    # （请求异常不在此捕获，由 main 中的 asyncio.gather(return_exceptions=True) 统一收集）
+    volume_data = await get_user_volume_shared(headers, cookies_str)
+    volume_list = volume_data.get("tradeVolumeInfoList", [])
+
+    if target_token:
+        # 查询指定代币
+        token_info = await get_token_info_cached(target_token, headers, cookies_str)
+        if not token_info:
+            print(f"⚠️ 用户{user.id} 未找到代币信息: {target_token}")
+            return None
+
+        mul_point = int(token_info.get("mulPoint", 1) or 1)
+
+        # 从 tradeVolumeInfoList 中查找目标代币
+        for token_vol in volume_list:
+            if token_vol.get("tokenName") == target_token:
+                displayed_volume = Decimal(str(token_vol.get("volume", 0)))
+                real_volume = displayed_volume / Decimal(str(mul_point))
+
+                return {
+                    "user_id": user.id,
+                    "name": user.name,
+                    "token_volumes": {target_token: {
+                        "displayed_volume": displayed_volume,
+                        "real_volume": real_volume,
+                    }},
+                }
+
+        # 未找到该代币的交易量
+        return {
+            "user_id": user.id,
+            "name": user.name,
+            "token_volumes": {target_token: {
+                "displayed_volume": Decimal("0"),
+                "real_volume": Decimal("0"),
+            }},
+        }
+    else:
+        # 查询所有代币
+        token_volumes = {}
+        
+        # 获取所有代币信息（用于mulPoint处理）
+        all_tokens = set()
+        for token_vol in volume_list:
+            token_name = token_vol.get("tokenName")
+            if token_name:
+                all_tokens.add(token_name)
+        
+        # 批量获取代币信息
+        for token_name in all_tokens:
+            try:
+                token_info = await get_token_info_cached(token_name, headers, cookies_str)
+                if token_info:
+                    mul_point = int(token_info.get("mulPoint", 1) or 1)
+                    
+                    # 查找对应的交易量
                     for token_vol in volume_list:
                         if token_vol.get("tokenName") == token_name:
                             displayed_volume = Decimal(str(token_vol.get("volume", 0)))
+                            real_volume = displayed_volume / Decimal(str(mul_point))
+                            
                             token_volumes[token_name] = {
                                 "displayed_volume": displayed_volume,
-                                "real_volume": displayed_volume,  # 默认mulPoint=1
+                                "real_volume": real_volume,
                             }
                             break
+            except Exception:
+                # 如果获取代币信息失败，使用默认mulPoint=1
+                for token_vol in volume_list:
+                    if token_vol.get("tokenName") == token_name:
+                        displayed_volume = Decimal(str(token_vol.get("volume", 0)))
+                        token_volumes[token_name] = {
+                            "displayed_volume": displayed_volume,
+                            "real_volume": displayed_volume,  # 默认mulPoint=1
+                        }
+                        break
 
-            return {
-                "user_id": user.id,
-                "name": user.name,
-                "token_volumes": token_volumes,
-            }
-
-    except Exception as e:
-        print(f"⚠️ 用户{user.id} 查询交易量异常: {e}")
-        return None
+        return {
+            "user_id": user.id,
+            "name": user.name,
+            "token_volumes": token_volumes,
+        }
 
 
 async def main(target_token: str | None = None):
@@ -268,10 +262,15 @@ async def main(target_token: str | None = None):
     # 并行查询所有用户
     print(f"🔍 开始并行查询 {len(users)} 个用户的交易量...")
     tasks = [query_single_user(user, target_token) for user in users]
-    results = await asyncio.gather(*tasks)
+    results = await asyncio.gather(*tasks, return_exceptions=True)
 
-    # 过滤掉失败的查询结果
-    user_results = [r for r in results if r is not None]
+    # 过滤掉失败的查询结果（含 CancelledError 等 BaseException）
+    user_results = []
+    for user, result in zip(users, results, strict=True):
+        if isinstance(result, BaseException):
+            print(f"⚠️ 用户{user.id} 查询交易量异常: {result}")
+        elif result is not None:
+            user_results.append(result)
 
     if not user_results:
         print("⚠️ 所有用户查询均失败")
@@ -357,6 +356,7 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
+    install_uvloop()
     try:
         asyncio.run(main(args.token))
     except KeyboardInterrupt:
@@ -24,6 +24,7 @@ import sys
 import threading
 
 from binance.application.services.strategy_executor import StrategyExecutor
+from binance.infrastructure.event_loop import install_uvloop
 from binance.infrastructure.logging.logger import get_logger
 
 
@@ -220,6 +221,7 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    install_uvloop()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -1,7 +1,7 @@
 """订单执行服务"""
 
 import asyncio
-from datetime import datetime
+import time
 from typing import Any
 
 from binance.application.services.notification_service import NotificationService
@@ -73,8 +73,8 @@ class OrderExecutionService:
 
             # 创建订单对（使用临时ID，实际应该从数据库获取）
             temp_order_id = (
-                int(datetime.now().timestamp() * 1000) % 1000000
-            )  # 简单的临时ID生成
+                time.time_ns() // 1_000_000 % 1000000
+            )  # 简单的临时ID生成（整数毫秒时间戳，避免浮点换算）
             order_pair = self.order_executor.create_order_pair(
                 user_id=user_id,
                 symbol=symbol,
@@ -32,6 +32,11 @@ from binance.infrastructure.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 订单终止状态（进入后不再变化，等待者可以返回）
+_ORDER_TERMINAL_STATUSES = frozenset({"FILLED", "CANCELED", "REJECTED", "EXPIRED"})
+# 未成交的终止状态
+_ORDER_UNFILLED_TERMINAL_STATUSES = _ORDER_TERMINAL_STATUSES - {"FILLED"}
+
 
 class AuthenticationError(Exception):
     """认证失败异常"""
@@ -56,6 +61,12 @@ class StrategyExecutor:
         self._stop_flags: dict[str, bool] = {}
         self._force_stop = False
 
+        # 同时执行策略的用户数上限（跨策略共享，超出的用户排队等待）
+        self._max_concurrent_users = (
+            self.config_manager.get_global_settings().max_concurrent_users
+        )
+        self._user_slots = asyncio.Semaphore(self._max_concurrent_users)
+
         # 共享的 HTTP 客户端（用于并发请求）
         self._shared_client: httpx.AsyncClient | None = None
         self._client_lock = asyncio.Lock()
@@ -240,24 +251,27 @@ class StrategyExecutor:
         try:
             # 为每个用户创建并发任务
             user_tasks = []
+            task_user_ids = []
             for user_id in strategy.user_ids:
                 user_strategy = self.config_manager.get_user_strategy_config(
                     user_id, strategy.strategy_id
                 )
                 if user_strategy:
                     task = asyncio.create_task(
-                        self._run_user_strategy(user_id, user_strategy)
+                        self._run_user_strategy_limited(user_id, user_strategy)
                     )
                     user_tasks.append(task)
+                    task_user_ids.append(user_id)
 
             # 等待所有用户任务完成
+            # （跳过了无配置的用户，需按 task_user_ids 对应结果，而非 strategy.user_ids）
             if user_tasks:
                 results = await asyncio.gather(*user_tasks, return_exceptions=True)
-                for idx, result in enumerate(results):
+                for user_id, result in zip(task_user_ids, results, strict=True):
                     if isinstance(result, Exception):
                         logger.error(
                             "用户策略执行异常",
-                            user_id=strategy.user_ids[idx],
+                            user_id=user_id,
                             error=str(result),
                         )
 
@@ -269,6 +283,32 @@ class StrategyExecutor:
                 "策略主任务完成，用户任务可能仍在运行", strategy_id=strategy.strategy_id
             )
 
+    async def _run_user_strategy_limited(
+        self, user_id: int, strategy: StrategyConfig
+    ) -> None:
+        """在 max_concurrent_users 限制内运行单个用户的策略
+
+        名额已满时排队等待；获得名额时策略已停止则直接返回，不再建立连接。
+        """
+        if self._user_slots.locked():
+            # 用户策略运行至达标才释放名额，排队可能持续较长时间
+            logger.info(
+                "用户策略排队等待执行名额",
+                user_id=user_id,
+                strategy_id=strategy.strategy_id,
+                max_concurrent_users=self._max_concurrent_users,
+            )
+
+        async with self._user_slots:
+            if self._stop_flags.get(strategy.strategy_id, False) or self._force_stop:
+                logger.info(
+                    "策略已停止，跳过排队中的用户",
+                    user_id=user_id,
+                    strategy_id=strategy.strategy_id,
+                )
+                return
+            await self._run_user_strategy(user_id, strategy)
+
     async def _run_user_strategy(self, user_id: int, strategy: StrategyConfig) -> None:
         """运行单个用户的策略（新逻辑：循环批次执行）
 
@@ -1388,7 +1428,7 @@ class StrategyExecutor:
 
         # 如果订单完全成交或取消，触发事件
         status = order_data.get("status")
-        if status in ["FILLED", "CANCELED", "REJECTED", "EXPIRED"]:
+        if status in _ORDER_TERMINAL_STATUSES:
             if order_key in self._order_events:
                 self._order_events[order_key].set()
 
@@ -1428,7 +1468,7 @@ class StrategyExecutor:
                 "订单已成交（检查时已完成）", order_id=order_id, user_id=user_id
             )
             return True
-        elif status in ["CANCELED", "REJECTED", "EXPIRED"]:
+        elif status in _ORDER_UNFILLED_TERMINAL_STATUSES:
             logger.warning(
                 "订单未成交（检查时已终止）",
                 order_id=order_id,
@@ -84,10 +84,22 @@ CACHE_TTL_PRICE = 60  # 价格数据缓存60秒
 # API请求超时（秒）
 API_TIMEOUT_DEFAULT = 30  # 默认超时
 API_TIMEOUT_WEBSOCKET = 10  # WebSocket超时
+API_REQUEST_DEADLINE = 60  # 单次API调用总时限（含重试等待）
+
+# HTTP连接池配置（所有请求都指向同一主机，保活连接数与并发上限接近以复用连接）
+HTTP_MAX_CONNECTIONS = 100  # 最大连接数
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 64  # 最大保持活动连接数
+HTTP_KEEPALIVE_EXPIRY = 75  # 空闲保活连接过期时间（秒）
+HTTP_MAX_INFLIGHT_PER_HOST = 64  # 每个主机同时在途的最大请求数（跨客户端实例）
 
 # 重试配置
 MAX_RETRY_ATTEMPTS = 3  # 最大重试次数
 RETRY_DELAY_BASE = 1  # 重试基础延迟（秒）
+RETRY_DELAY_MAX = 10  # 重试最大延迟（秒）
+
+# 熔断配置
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5  # 连续失败次数阈值
+CIRCUIT_BREAKER_RECOVERY_TIMEOUT = 30  # 熔断恢复等待时间（秒）
 
 # WebSocket URL
 BINANCE_WS_BASE_URL = "wss://nbstream.binance.com/lvt-p"
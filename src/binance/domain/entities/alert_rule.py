@@ -1,5 +1,7 @@
 """告警规则实体"""
 
+import operator
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
@@ -9,6 +11,17 @@ from typing import Any
 from binance.domain.entities.system_metrics import MetricStatus, MetricType
 
 
+# 阈值操作符 -> 比较函数（告警规则按指标逐条评估，查表代替逐个比较操作符字符串）
+_THRESHOLD_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+
 class AlertRuleType(str, Enum):
     """告警规则类型"""
 
@@ -101,20 +114,11 @@ class AlertRule:
         if self.threshold_value is None:
             return False
 
-        if self.threshold_operator == ">":
-            return metric_value > self.threshold_value
-        elif self.threshold_operator == "<":
-            return metric_value < self.threshold_value
-        elif self.threshold_operator == ">=":
-            return metric_value >= self.threshold_value
-        elif self.threshold_operator == "<=":
-            return metric_value <= self.threshold_value
-        elif self.threshold_operator == "==":
-            return metric_value == self.threshold_value
-        elif self.threshold_operator == "!=":
-            return metric_value != self.threshold_value
+        compare = _THRESHOLD_OPERATORS.get(self.threshold_operator)
+        if compare is None:
+            return False
 
-        return False
+        return compare(metric_value, self.threshold_value)
 
     def _check_rate_change(self, metric_value: Decimal, timestamp: datetime) -> bool:
         """检查变化率告警"""
@@ -7,7 +7,7 @@ from decimal import Decimal
 from binance.domain.value_objects.price import Price
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceData:
     """价格数据实体
 
@@ -11,6 +11,12 @@ from binance.domain.value_objects.price import Price
 from binance.infrastructure.config import TradingTarget
 
 
+# 买卖价差百分比的合理区间（模块级常量，避免每次验证重新构造Decimal）
+_HUNDRED = Decimal("100")
+_MIN_SPREAD_PERCENTAGE = Decimal("0.1")  # 至少0.1%的价差
+_MAX_SPREAD_PERCENTAGE = Decimal("10")  # 最多10%的价差
+
+
 class OTOOrderExecutor:
     """OTO订单执行服务"""
 
@@ -132,16 +138,14 @@ class OTOOrderExecutor:
         self, symbol: str, quantity: Decimal, buy_price: Price, sell_price: Price
     ) -> tuple[bool, str]:
         """验证订单参数"""
-        # 检查数量
-        if quantity <= 0:
-            return False, "订单数量必须大于0"
-
-        # 检查价格
-        if buy_price.value <= 0:
-            return False, "买单价格必须大于0"
-
-        if sell_price.value <= 0:
-            return False, "卖单价格必须大于0"
+        # 检查数量和价格（按顺序返回第一个不合法的参数）
+        for value, message in (
+            (quantity, "订单数量必须大于0"),
+            (buy_price.value, "买单价格必须大于0"),
+            (sell_price.value, "卖单价格必须大于0"),
+        ):
+            if value <= 0:
+                return False, message
 
         # 检查价格关系（卖价应该低于买价，以便快速成交）
         if sell_price.value >= buy_price.value:
@@ -149,12 +153,12 @@ class OTOOrderExecutor:
 
         # 检查价格差异是否合理
         price_diff = buy_price.value - sell_price.value
-        price_diff_percentage = (price_diff / buy_price.value) * Decimal("100")
+        price_diff_percentage = (price_diff / buy_price.value) * _HUNDRED
 
-        if price_diff_percentage < Decimal("0.1"):  # 至少0.1%的价差
+        if price_diff_percentage < _MIN_SPREAD_PERCENTAGE:
             return False, "买卖价差过小，可能无法快速成交"
 
-        if price_diff_percentage > Decimal("10"):  # 最多10%的价差
+        if price_diff_percentage > _MAX_SPREAD_PERCENTAGE:
             return False, "买卖价差过大，可能造成较大损失"
 
         return True, "参数验证通过"
@@ -1,9 +1,19 @@
 """价格值对象"""
 
 from decimal import ROUND_DOWN, Decimal
+from functools import lru_cache
 from typing import Union
 
 
+@lru_cache(maxsize=32)
+def quantize_unit(precision: int) -> Decimal:
+    """获取指定精度的量化单位（如 8 -> 1E-8）
+
+    每个价格tick都要按精度量化，精度取值很少，缓存后无需重复构造Decimal。
+    """
+    return Decimal(1).scaleb(-precision)
+
+
 class Price:
     """价格值对象
 
@@ -43,8 +53,7 @@ class Price:
         if precision < 0:
             precision = 0
 
-        quantize_value = Decimal("0.1") ** precision
-        return value.quantize(quantize_value, rounding=ROUND_DOWN)
+        return value.quantize(quantize_unit(precision), rounding=ROUND_DOWN)
 
     @property
     def value(self) -> Decimal:
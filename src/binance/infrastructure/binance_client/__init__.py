@@ -1,6 +1,7 @@
 """币安API客户端"""
 
+from .circuit_breaker import CircuitOpenError
 from .http_client import BinanceClient
 
 
-__all__ = ["BinanceClient"]
+__all__ = ["BinanceClient", "CircuitOpenError"]
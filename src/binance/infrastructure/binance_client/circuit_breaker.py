@@ -0,0 +1,136 @@
+"""HTTP熔断器
+
+连续失败达到阈值后熔断（OPEN），在恢复期内直接拒绝请求，
+避免对已不可用的服务反复等待超时；恢复期后只放行一个试探请求（HALF_OPEN），
+成功则恢复（CLOSED），失败则重新熔断。
+"""
+
+import time
+from enum import Enum
+
+from binance.config.constants import (
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
+)
+from binance.infrastructure.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class CircuitState(str, Enum):
+    """熔断器状态"""
+
+    CLOSED = "CLOSED"  # 正常放行
+    OPEN = "OPEN"  # 熔断中，拒绝请求
+    HALF_OPEN = "HALF_OPEN"  # 试探恢复
+
+
+class CircuitOpenError(Exception):
+    """熔断器打开，请求被拒绝"""
+
+    def __init__(self, host: str, retry_after: float):
+        self.host = host
+        self.retry_after = retry_after
+        super().__init__(f"熔断中，暂停请求 {host}（{retry_after:.1f}秒后重试）")
+
+
+class CircuitBreaker:
+    """按主机维度的熔断器"""
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        recovery_timeout: float = CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
+    ):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = CircuitState.CLOSED
+        self.failure_count = 0
+        self.last_failure_time = 0.0
+        self._probe_in_flight = False
+
+    def _remaining(self) -> float:
+        """距离进入试探恢复的剩余时间（秒）"""
+        elapsed = time.monotonic() - self.last_failure_time
+        return max(0.0, self.recovery_timeout - elapsed)
+
+    def allow(self) -> bool:
+        """是否允许发送请求（HALF_OPEN 时只放行一个试探请求）"""
+        if self.state == CircuitState.CLOSED:
+            return True
+
+        if self.state == CircuitState.OPEN:
+            if self._remaining() > 0:
+                return False
+            self.state = CircuitState.HALF_OPEN
+            logger.info("circuit_half_open", host=self.host)
+
+        # HALF_OPEN：试探请求返回结果前拒绝其他请求
+        if self._probe_in_flight:
+            return False
+        self._probe_in_flight = True
+        return True
+
+    def check(self) -> bool:
+        """检查是否允许发送请求
+
+        Returns:
+            本次请求是否为试探请求（为True时请求结束后须调用 release_probe）
+
+        Raises:
+            CircuitOpenError: 熔断器打开
+        """
+        probe = self.state != CircuitState.CLOSED
+        if not self.allow():
+            raise CircuitOpenError(self.host, self._remaining())
+        return probe
+
+    def release_probe(self) -> None:
+        """释放试探请求名额（试探请求被取消或未记录结果时，允许下一个请求试探）"""
+        self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        """记录请求成功"""
+        if self.state != CircuitState.CLOSED:
+            logger.info("circuit_closed", host=self.host)
+        self.state = CircuitState.CLOSED
+        self.failure_count = 0
+
+    def record_failure(self) -> None:
+        """记录请求失败"""
+        self.failure_count += 1
+        self.last_failure_time = time.monotonic()
+        self._probe_in_flight = False
+
+        if (
+            self.state == CircuitState.HALF_OPEN
+            or self.failure_count >= self.failure_threshold
+        ):
+            if self.state != CircuitState.OPEN:
+                logger.warning(
+                    "circuit_opened",
+                    host=self.host,
+                    failure_count=self.failure_count,
+                    recovery_timeout=self.recovery_timeout,
+                )
+            self.state = CircuitState.OPEN
+
+
+# 全局熔断器注册表（客户端实例生命周期较短，熔断状态需跨实例共享）
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(host: str) -> CircuitBreaker:
+    """获取指定主机的熔断器（不存在时创建）"""
+    breaker = _breakers.get(host)
+    if breaker is None:
+        breaker = _breakers[host] = CircuitBreaker(host)
+    return breaker
+
+
+def reset_circuit_breakers() -> None:
+    """清空所有主机的熔断状态（用于测试隔离）"""
+    _breakers.clear()
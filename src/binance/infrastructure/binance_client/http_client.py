@@ -1,16 +1,94 @@
 """币安HTTP客户端"""
 
+import asyncio
+import random
 import re
+from functools import lru_cache
+from importlib.util import find_spec
 from typing import Any
+from weakref import WeakKeyDictionary
 
 import httpx
 
-from binance.config.constants import API_TIMEOUT_DEFAULT, BINANCE_API_BASE_URL
+from binance.config.constants import (
+    API_REQUEST_DEADLINE,
+    API_TIMEOUT_DEFAULT,
+    BINANCE_API_BASE_URL,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_INFLIGHT_PER_HOST,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    MAX_RETRY_ATTEMPTS,
+    RETRY_DELAY_BASE,
+    RETRY_DELAY_MAX,
+)
+from binance.infrastructure import json_utils
+from binance.infrastructure.binance_client.circuit_breaker import (
+    get_circuit_breaker,
+)
 from binance.infrastructure.logging import get_logger
 
 
 logger = get_logger(__name__)
 
+# headers清理用的正则（预编译，避免每个值都重新查找模式缓存）
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x1f\x7f-\x9f]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# 可安全重试的HTTP方法（下单等非幂等请求不重试，避免重复提交）
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# 可重试的HTTP状态码（限流和服务端瞬时错误）
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# 压缩编码：br需要安装brotli/brotlicffi，httpx才能解压
+_ACCEPT_ENCODING = ", ".join(
+    (["br"] if find_spec("brotli") or find_spec("brotlicffi") else [])
+    + ["gzip", "deflate"]
+)
+
+# 安装h2后启用HTTP/2，同一连接上多路复用并发请求
+_HTTP2_ENABLED = find_spec("h2") is not None
+
+# API主机名（模块加载时解析一次，避免每个客户端实例重复解析URL）
+_API_HOST = httpx.URL(BINANCE_API_BASE_URL).host
+
+
+def _is_retryable(error: httpx.HTTPError) -> bool:
+    """判断HTTP错误是否为可重试的瞬时错误"""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in _RETRYABLE_STATUS_CODES
+    # 超时、连接失败等网络层错误
+    return isinstance(error, httpx.TransportError)
+
+
+# 按主机限制的全局并发请求数（客户端按操作创建，各自的连接池无法限制总并发）
+# asyncio.Semaphore 发生等待后会绑定当前事件循环，因此按事件循环分别创建，
+# 多次 asyncio.run()（脚本、测试）之间互不影响
+_inflight_limits: WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]
+] = WeakKeyDictionary()
+
+
+def _get_inflight_limit(host: str) -> asyncio.Semaphore:
+    """获取当前事件循环中指定主机的并发请求信号量（不存在时创建）"""
+    limits = _inflight_limits.setdefault(asyncio.get_running_loop(), {})
+    semaphore = limits.get(host)
+    if semaphore is None:
+        semaphore = limits[host] = asyncio.Semaphore(HTTP_MAX_INFLIGHT_PER_HOST)
+    return semaphore
+
+
+@lru_cache(maxsize=64)
+def _api_url(path: str) -> httpx.URL:
+    """构建并缓存接口的完整URL（接口路径固定，避免每次请求重新解析和拼接）"""
+    return httpx.URL(BINANCE_API_BASE_URL).join(path)
+
+
+def _retry_delay(attempt: int) -> float:
+    """计算重试等待时间（指数退避 + 全抖动）"""
+    return random.uniform(0, min(RETRY_DELAY_MAX, RETRY_DELAY_BASE * 2**attempt))
+
 
 class BinanceClient:
     """币安API客户端（异步HTTP）"""
@@ -20,23 +98,12 @@ class BinanceClient:
         cleaned_headers = {}
 
         for key, value in headers.items():
-            if isinstance(value, str):
-                # 移除所有控制字符（包括\r, \n, \t等）
-                cleaned_value = re.sub(r"[\x00-\x1f\x7f-\x9f]", "", value)
-                # 移除多余的空格
-                cleaned_value = cleaned_value.strip()
-                # 移除连续的空白字符
-                cleaned_value = re.sub(r"\s+", " ", cleaned_value)
-                # 确保key也是字符串
-                cleaned_key = str(key).strip()
-                cleaned_headers[cleaned_key] = cleaned_value
-            else:
-                # 非字符串值转换为字符串并清理
-                cleaned_value = re.sub(r"[\x00-\x1f\x7f-\x9f]", "", str(value))
-                cleaned_value = cleaned_value.strip()
-                cleaned_value = re.sub(r"\s+", " ", cleaned_value)
-                cleaned_key = str(key).strip()
-                cleaned_headers[cleaned_key] = cleaned_value
+            # 非字符串值先转换为字符串，再移除所有控制字符（包括\r, \n, \t等）
+            cleaned_value = _CONTROL_CHARS_RE.sub("", str(value)).strip()
+            # 移除连续的空白字符
+            cleaned_value = _WHITESPACE_RE.sub(" ", cleaned_value)
+            # 确保key也是字符串
+            cleaned_headers[str(key).strip()] = cleaned_value
 
         return cleaned_headers
 
@@ -55,22 +122,41 @@ class BinanceClient:
         self._headers = self._clean_headers(headers.copy() if headers else {})
         self._cookies = cookies
 
+        # 统一声明响应压缩编码（JSON压缩率高，可显著减少传输量）
+        # 浏览器抓取的headers可能包含未安装解码器的编码（如br、zstd），需覆盖
+        self._headers = {
+            k: v for k, v in self._headers.items() if k.lower() != "accept-encoding"
+        }
+        self._headers["Accept-Encoding"] = _ACCEPT_ENCODING
+
         # 将cookies添加到headers中（币安API可能需要这样）
         if cookies:
             self._headers["cookie"] = cookies
 
-        # 创建HTTP客户端（配置连接池以支持并发请求）
-        limits = httpx.Limits(
-            max_connections=100,  # 最大连接数
-            max_keepalive_connections=20,  # 最大保持活动连接数
-        )
-        self._client = httpx.AsyncClient(
-            base_url=BINANCE_API_BASE_URL,
-            headers=self._headers,
-            timeout=API_TIMEOUT_DEFAULT,
-            follow_redirects=True,
-            limits=limits,
-        )
+        # HTTP客户端延迟创建，首次请求时初始化并在实例内复用
+        self._client: httpx.AsyncClient | None = None
+
+        # 按主机共享的熔断器（连续失败后快速失败，不再等待超时）
+        self._breaker = get_circuit_breaker(_API_HOST)
+
+    def _ensure_client(self) -> httpx.AsyncClient:
+        """确保HTTP客户端已初始化（复用同一连接池，避免重复握手）"""
+        if self._client is None or self._client.is_closed:
+            # 创建HTTP客户端（配置连接池以支持并发请求）
+            limits = httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            )
+            self._client = httpx.AsyncClient(
+                base_url=BINANCE_API_BASE_URL,
+                headers=self._headers,
+                timeout=API_TIMEOUT_DEFAULT,
+                follow_redirects=True,
+                limits=limits,
+                http2=_HTTP2_ENABLED,
+            )
+        return self._client
 
     @staticmethod
     def _parse_cookies(cookie_string: str | None) -> dict[str, str] | None:
@@ -97,6 +183,7 @@ class BinanceClient:
         self,
         method: str,
         path: str,
+        deadline: float | None = API_REQUEST_DEADLINE,
         **kwargs: Any,
     ) -> dict[str, Any]:
         """发送HTTP请求
@@ -104,39 +191,102 @@ class BinanceClient:
         Args:
             method: HTTP方法（GET, POST等）
             path: API路径
+            deadline: 整个请求（含重试等待）的总时限（秒），None表示不限制
             **kwargs: httpx请求参数
 
         Returns:
             API响应JSON
 
         Raises:
-            httpx.HTTPError: HTTP请求错误
+            CircuitOpenError: 熔断器打开
+            httpx.HTTPError: HTTP请求错误（超过总时限时为httpx.TimeoutException）
             ValueError: API返回错误码
         """
         try:
-            response = await self._client.request(method, path, **kwargs)
-            response.raise_for_status()
-
-            data = response.json()
-
-            # 检查API返回的业务状态
-            if not data.get("success", False):
-                error_code = data.get("code", "UNKNOWN")
-                error_msg = data.get("message", "Unknown error")
-                logger.error(
-                    "binance_api_error",
-                    path=path,
-                    code=error_code,
-                    message=error_msg,
-                )
-                raise ValueError(f"API错误 [{error_code}]: {error_msg}")
-
-            logger.debug("binance_api_success", path=path, data=data)
-            return data
-
-        except httpx.HTTPError as e:
-            logger.error("binance_http_error", path=path, error=str(e))
-            raise
+            async with asyncio.timeout(deadline):
+                response = await self._send_with_retry(method, path, **kwargs)
+        except TimeoutError as e:
+            # 超时取消发生在重试循环内部，_send_with_retry 来不及记录失败，在此补记
+            self._breaker.record_failure()
+            logger.error(
+                "binance_request_deadline_exceeded", path=path, deadline=deadline
+            )
+            raise httpx.TimeoutException(f"请求超过总时限 {deadline}秒: {path}") from e
+
+        data = json_utils.loads(response.content)
+
+        # 检查API返回的业务状态
+        if not data.get("success", False):
+            error_code = data.get("code", "UNKNOWN")
+            error_msg = data.get("message", "Unknown error")
+            logger.error(
+                "binance_api_error",
+                path=path,
+                code=error_code,
+                message=error_msg,
+            )
+            raise ValueError(f"API错误 [{error_code}]: {error_msg}")
+
+        logger.debug("binance_api_success", path=path, data=data)
+        return data
+
+    async def _send_with_retry(
+        self,
+        method: str,
+        path: str,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """发送HTTP请求，幂等请求遇到瞬时错误时按指数退避重试
+
+        重试等待使用 asyncio.sleep，不会阻塞事件循环中的其他请求。
+        重试用尽后的瞬时错误计入熔断器，熔断期间直接拒绝请求。
+
+        Raises:
+            CircuitOpenError: 熔断器打开
+            httpx.HTTPError: 不可重试的错误或重试次数用尽
+        """
+        probe = self._breaker.check()
+        max_retries = MAX_RETRY_ATTEMPTS if method.upper() in _IDEMPOTENT_METHODS else 0
+
+        try:
+            attempt = 0
+            while True:
+                try:
+                    client = self._ensure_client()
+                    # 按主机共享的并发上限（隔舱），防止大量并发请求耗尽连接和文件描述符
+                    async with _get_inflight_limit(_API_HOST):
+                        response = await client.request(
+                            method, _api_url(path), **kwargs
+                        )
+                    response.raise_for_status()
+                    self._breaker.record_success()
+                    return response
+
+                except httpx.HTTPError as e:
+                    retryable = _is_retryable(e)
+                    if attempt >= max_retries or not retryable:
+                        # 非瞬时错误（如认证失败）说明服务可达，不计入熔断
+                        if retryable:
+                            self._breaker.record_failure()
+                        else:
+                            self._breaker.record_success()
+                        logger.error("binance_http_error", path=path, error=str(e))
+                        raise
+
+                    delay = _retry_delay(attempt)
+                    attempt += 1
+                    logger.warning(
+                        "binance_http_retry",
+                        path=path,
+                        attempt=attempt,
+                        delay=round(delay, 3),
+                        error=str(e),
+                    )
+                    await asyncio.sleep(delay)
+        finally:
+            # 试探请求被取消（如超过总时限）时释放名额，避免熔断器卡在HALF_OPEN
+            if probe:
+                self._breaker.release_probe()
 
     async def get_wallet_balance(self) -> dict[str, Any]:
         """查询Alpha钱包余额
@@ -297,9 +447,34 @@ class BinanceClient:
         response = await self._request("GET", path)
         return response.get("data", {})
 
+    async def gather(
+        self,
+        specs: list[tuple[str, str, dict[str, Any]]],
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """并发发送多个独立请求（共享同一连接池），结果按输入顺序返回
+
+        Args:
+            specs: 请求列表，每项为 (method, path, httpx请求参数)
+            return_exceptions: 为True时异常作为结果返回，而不是中断整个批次
+
+        Returns:
+            各请求的API响应JSON列表
+
+        Example:
+            results = await client.gather([("GET", path, {}) for path in paths])
+        """
+        results: list[Any] = await asyncio.gather(
+            *(self._request(method, path, **kwargs) for method, path, kwargs in specs),
+            return_exceptions=return_exceptions,
+        )
+        return results
+
     async def close(self) -> None:
         """关闭HTTP客户端"""
-        await self._client.aclose()
+        if self._client:
+            await self._client.aclose()
+            self._client = None
 
     async def __aenter__(self) -> "BinanceClient":
         """异步上下文管理器入口"""
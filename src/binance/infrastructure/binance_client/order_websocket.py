@@ -8,6 +8,7 @@ from typing import Any
 
 import websockets
 
+from binance.infrastructure import json_utils
 from binance.infrastructure.logging.logger import get_logger
 
 
@@ -169,7 +170,7 @@ class OrderWebSocketConnector:
     async def _handle_message(self, message: str) -> None:
         """处理WebSocket消息"""
         try:
-            data = json.loads(message)
+            data = json_utils.loads(message)
 
             # 打印所有收到的消息（用于调试）
             logger.info(f"收到WebSocket消息: {data}")
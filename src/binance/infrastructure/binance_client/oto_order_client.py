@@ -6,7 +6,7 @@ from typing import NamedTuple
 
 import httpx
 
-from binance.domain.value_objects.price import Price
+from binance.domain.value_objects.price import Price, quantize_unit
 from binance.infrastructure.config import SymbolMapper
 from binance.infrastructure.logging.logger import get_logger
 
@@ -109,7 +109,21 @@ class BinanceOTOOrderClient:
             # 使用Decimal进行精确计算，然后转换为字符串
             total_amount_decimal = buy_price_decimal * quantity_decimal
             total_amount_decimal = total_amount_decimal.quantize(
-                Decimal(f"1e-{effective_precision}"), rounding=ROUND_DOWN
+                quantize_unit(effective_precision), rounding=ROUND_DOWN
+            )
+
+            # 下单参数字符串只格式化一次，订单参数与日志共用
+            working_price = self._decimal_to_payload(
+                buy_price_decimal, effective_precision
+            )
+            working_quantity = self._decimal_to_payload(
+                quantity_decimal, quantity_precision
+            )
+            pending_price = self._decimal_to_payload(
+                sell_price_decimal, effective_precision
+            )
+            payment_amount = self._decimal_to_payload(
+                total_amount_decimal, effective_precision
             )
 
             # 构建OTO订单参数 - 使用正确的API格式
@@ -117,23 +131,12 @@ class BinanceOTOOrderClient:
                 "baseAsset": resolved_symbol.base_asset,
                 "quoteAsset": resolved_symbol.quote_asset,
                 "workingSide": "BUY",
-                "workingPrice": self._decimal_to_payload(
-                    buy_price_decimal, effective_precision
-                ),
-                "workingQuantity": self._decimal_to_payload(
-                    quantity_decimal, quantity_precision
-                ),
+                "workingPrice": working_price,
+                "workingQuantity": working_quantity,
                 "paymentDetails": [
-                    {
-                        "amount": self._decimal_to_payload(
-                            total_amount_decimal, effective_precision
-                        ),
-                        "paymentWalletType": "CARD",
-                    }
+                    {"amount": payment_amount, "paymentWalletType": "CARD"}
                 ],
-                "pendingPrice": self._decimal_to_payload(
-                    sell_price_decimal, effective_precision
-                ),
+                "pendingPrice": pending_price,
             }
 
             logger.info(
@@ -142,16 +145,10 @@ class BinanceOTOOrderClient:
                 alpha_symbol=resolved_symbol.base_asset,
                 precision=effective_precision,
                 quantity_precision=quantity_precision,
-                quantity=self._decimal_to_payload(quantity_decimal, quantity_precision),
-                buy_price=self._decimal_to_payload(
-                    buy_price_decimal, effective_precision
-                ),
-                sell_price=self._decimal_to_payload(
-                    sell_price_decimal, effective_precision
-                ),
-                amount=self._decimal_to_payload(
-                    total_amount_decimal, effective_precision
-                ),
+                quantity=working_quantity,
+                buy_price=working_price,
+                sell_price=pending_price,
+                amount=payment_amount,
             )
 
             # 发送订单请求到正确的API端点
@@ -246,7 +243,7 @@ class BinanceOTOOrderClient:
 
     @staticmethod
     def _decimal_to_payload(value: Decimal, precision: int) -> str:
-        quantized = value.quantize(Decimal(f"1e-{precision}"), rounding=ROUND_DOWN)
+        quantized = value.quantize(quantize_unit(precision), rounding=ROUND_DOWN)
         return format(quantized, f".{precision}f")
 
     @staticmethod
@@ -258,11 +255,8 @@ class BinanceOTOOrderClient:
         minimum: Decimal | None = None,
     ) -> Decimal:
         decimal_value = Decimal(str(value))
-        quantize_unit = Decimal(f"1e-{precision}")
-
-        if tick:
-            quantize_unit = tick
-        decimal_value = decimal_value.quantize(quantize_unit, rounding=ROUND_DOWN)
+        unit = tick or quantize_unit(precision)
+        decimal_value = decimal_value.quantize(unit, rounding=ROUND_DOWN)
 
         if step:
             steps = (decimal_value / step).to_integral_value(rounding=ROUND_DOWN)
@@ -271,7 +265,7 @@ class BinanceOTOOrderClient:
         if minimum is not None and decimal_value < minimum:
             decimal_value = minimum
 
-        return decimal_value.quantize(quantize_unit, rounding=ROUND_DOWN)
+        return decimal_value.quantize(unit, rounding=ROUND_DOWN)
 
     async def cancel_order(self, symbol: str, order_id: str) -> tuple[bool, str]:
         """取消订单"""
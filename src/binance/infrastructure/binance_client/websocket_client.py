@@ -7,6 +7,7 @@ from collections.abc import Callable
 import websockets
 from websockets.exceptions import ConnectionClosed, WebSocketException
 
+from binance.infrastructure import json_utils
 from binance.infrastructure.logging.logger import get_logger
 
 
@@ -100,7 +101,7 @@ class BinanceWebSocketClient:
             message: 原始消息字符串
         """
         try:
-            data = json.loads(message)
+            data = json_utils.loads(message)
 
             # 根据消息类型调用相应的处理器
             message_type = data.get("e", "unknown")
@@ -72,6 +72,12 @@ class StrategyConfigManager:
     def _parse_global_settings(self) -> None:
         """解析全局设置"""
         settings = self._config.get("global_settings", {})
+        max_concurrent_users = int(settings.get("max_concurrent_users", 10))
+        if max_concurrent_users < 1:
+            # 用作并发信号量的初始值：0 会使用户任务永久排队，负数直接报错
+            raise ValueError(
+                f"max_concurrent_users 必须大于等于1，当前值: {max_concurrent_users}"
+            )
         self._global_settings = GlobalSettings(
             default_buy_offset_percentage=Decimal(
                 str(settings.get("default_buy_offset_percentage", 0.5))
@@ -88,7 +94,7 @@ class StrategyConfigManager:
             default_volume_check_delay_seconds=int(
                 settings.get("default_volume_check_delay_seconds", 60)
             ),
-            max_concurrent_users=int(settings.get("max_concurrent_users", 10)),
+            max_concurrent_users=max_concurrent_users,
             max_price_volatility_percentage=Decimal(
                 str(settings.get("max_price_volatility_percentage", 5.0))
             ),
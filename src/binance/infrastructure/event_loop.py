@@ -0,0 +1,25 @@
+"""事件循环配置"""
+
+import asyncio
+import sys
+
+
+def install_uvloop() -> bool:
+    """使用uvloop作为默认事件循环策略（可用时）
+
+    uvloop 基于 libuv，HTTP/WebSocket 等网络密集场景下比标准库事件循环更快。
+    uvloop 不支持 Windows，未安装或不支持时保持标准库事件循环。
+
+    Returns:
+        是否已启用uvloop
+    """
+    if sys.platform == "win32":
+        return False
+
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
@@ -0,0 +1,22 @@
+"""JSON解析
+
+安装 orjson 时使用 orjson（可直接解析 bytes，速度约为标准库 json 的数倍），
+否则使用标准库 json。orjson.JSONDecodeError 继承自 json.JSONDecodeError，
+调用方按 json.JSONDecodeError 捕获即可。
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+
+def _select_loads() -> Callable[[str | bytes], Any]:
+    """选择可用的JSON解析函数（orjson为可选依赖）"""
+    try:
+        from orjson import loads
+    except ImportError:
+        return json.loads
+    return loads
+
+
+loads: Callable[[str | bytes], Any] = _select_loads()
@@ -36,8 +36,8 @@ def _format_console_output(_logger: Any, _name: str, event_dict: dict) -> str:
         if isinstance(timestamp, datetime):
             time_str = timestamp.strftime("%H:%M:%S")
         elif isinstance(timestamp, str):
-            dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-            time_str = dt.strftime("%H:%M:%S")
+            # TimeStamper(fmt="iso") 格式固定为 YYYY-MM-DDTHH:MM:SS...，直接截取时分秒
+            time_str = timestamp[11:19]
         else:
             time_str = str(timestamp)[:8]
     except Exception:
@@ -0,0 +1,71 @@
+"""pytest全局配置"""
+
+import os
+import re
+import shlex
+
+import pytest
+
+from binance.infrastructure.event_loop import install_uvloop
+
+
+# pytest-asyncio 使用全局事件循环策略创建事件循环
+install_uvloop()
+
+
+_TRUTHY = {"1", "true", "yes", "on"}
+_VERBOSITY_FLAGS = {"--verbose", "--quiet", "--verbosity"}
+
+
+def _explicit_args(config: pytest.Config) -> list[str]:
+    """命令行及 PYTEST_ADDOPTS 中显式传入的参数（不含pytest.ini中的addopts）"""
+    return [
+        *config.invocation_params.args,
+        *shlex.split(os.getenv("PYTEST_ADDOPTS", "")),
+    ]
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """CI环境下精简输出（覆盖pytest.ini中的 -v / --tb=short），减少逐用例输出
+
+    只覆盖来自pytest.ini的默认值，显式传入的 -vv、--tb=long 等保持不变。
+    """
+    if os.getenv("CI", "").strip().lower() not in _TRUTHY:
+        return
+
+    args = _explicit_args(config)
+    if not any(
+        re.fullmatch(r"-(v+|q+)", arg) or arg.split("=", 1)[0] in _VERBOSITY_FLAGS
+        for arg in args
+    ):
+        config.option.verbose = -1
+    if not any(arg.split("=", 1)[0] == "--tb" for arg in args):
+        config.option.tbstyle = "line"
+
+
+# 集成测试开关（需要真实数据库和用户认证信息）
+INTEGRATION_ENV_VAR = "BINANCE_INTEGRATION"
+
+
+def integration_enabled() -> bool:
+    """是否启用集成测试"""
+    # Windows cmd 的 `set X=1 && ...` 会保留尾随空格，比较前去除空白
+    return os.getenv(INTEGRATION_ENV_VAR, "").strip() == "1"
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """未启用集成测试时，在收集阶段直接跳过integration目录下的用例
+
+    避免在没有数据库/认证信息的环境中逐个用例连接数据库后再跳过。
+    """
+    if integration_enabled():
+        return
+
+    skip_integration = pytest.mark.skip(
+        reason=f"未设置 {INTEGRATION_ENV_VAR}=1，跳过集成测试"
+    )
+    for item in items:
+        if "integration" in item.path.parts:
+            item.add_marker(skip_integration)
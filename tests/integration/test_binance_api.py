@@ -7,59 +7,80 @@
 4. 第四阶段：完整交易流程测试（后续实现）
 
 注意：这些测试需要真实的用户认证信息（headers和cookies）
+运行前需设置环境变量 BINANCE_INTEGRATION=1，否则在收集阶段全部跳过
 """
 
+import asyncio
 import json
+import sys
+from itertools import repeat
 
 import pytest
 import pytest_asyncio
 
+from binance.infrastructure import json_utils
 from binance.infrastructure.binance_client.http_client import BinanceClient
 from binance.infrastructure.database.repositories.user_repository_impl import (
     UserRepositoryImpl,
 )
-from binance.infrastructure.database.session import get_db
+from binance.infrastructure.database.session import close_db, get_db
+
+
+# 所有用例共享同一个事件循环，以便复用会话级的数据库连接
+pytestmark = [pytest.mark.integration, pytest.mark.asyncio(loop_scope="session")]
+
+
+def _report(lines: list[str]) -> None:
+    """一次性输出测试报告（避免逐行print带来的多次stdout写入）"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _db_session():
+    """整个测试会话共享的数据库会话（只建立一次连接）"""
+    async for session in get_db():
+        yield session
+    await close_db()
 
 
 class TestBinanceAPI:
     """币安私有API集成测试类"""
 
-    @pytest_asyncio.fixture
-    async def user_credentials(self):
+    @pytest_asyncio.fixture(scope="class", loop_scope="session")
+    async def user_credentials(self, _db_session):
         """从数据库获取测试用户的认证信息"""
-        async for session in get_db():
-            user_repo = UserRepositoryImpl(session)
-            # 获取第一个有效用户
-            user = await user_repo.get_by_id(1)
-
-            if not user or not user.has_credentials():
-                pytest.skip("测试用户不存在或没有认证信息")
-
-            # 获取认证信息（明文）
-            headers_str = user.headers
-            cookies_str = user.cookies
-
-            # 解析headers（JSON格式）
-            headers_dict = json.loads(headers_str)
-
-            # 解析cookies（可能是JSON或字符串格式）
-            try:
-                cookies_obj = json.loads(cookies_str)
-                # 如果是JSON对象，转换为字符串格式
-                cookies_str = "; ".join([f"{k}={v}" for k, v in cookies_obj.items()])
-            except json.JSONDecodeError:
-                # 已经是字符串格式，直接使用
-                pass
-
-            return {
-                "headers": headers_dict,
-                "cookies": cookies_str,
-                "user": user,
-            }
-
-    @pytest_asyncio.fixture
+        user_repo = UserRepositoryImpl(_db_session)
+        # 获取第一个有效用户
+        user = await user_repo.get_by_id(1)
+
+        if not user or not user.has_credentials():
+            pytest.skip("测试用户不存在或没有认证信息")
+
+        # 获取认证信息（明文）
+        headers_str = user.headers
+        cookies_str = user.cookies
+
+        # 解析headers（JSON格式）
+        headers_dict = json_utils.loads(headers_str)
+
+        # 解析cookies（可能是JSON或字符串格式）
+        try:
+            cookies_obj = json_utils.loads(cookies_str)
+            # 如果是JSON对象，转换为字符串格式
+            cookies_str = "; ".join(f"{k}={v}" for k, v in cookies_obj.items())
+        except json.JSONDecodeError:
+            # 已经是字符串格式，直接使用
+            pass
+
+        return {
+            "headers": headers_dict,
+            "cookies": cookies_str,
+            "user": user,
+        }
+
+    @pytest_asyncio.fixture(scope="class", loop_scope="session")
     async def binance_client(self, user_credentials):
-        """创建币安API客户端"""
+        """创建币安API客户端（类内所有用例共享同一个客户端和连接池）"""
         client = BinanceClient(
             headers=user_credentials["headers"],
             cookies=user_credentials["cookies"],
@@ -71,7 +92,6 @@ class TestBinanceAPI:
     # 第一阶段：代币信息测试（符号映射和精度）
     # ========================================================================
 
-    @pytest.mark.asyncio
     async def test_1_get_token_info(self, binance_client):
         """测试获取代币信息（符号映射）
 
@@ -80,9 +100,7 @@ class TestBinanceAPI:
         - 返回代币列表
         - 每个代币包含必要的字段（symbol, price等）
         """
-        print("\n" + "=" * 80)
-        print("【第一阶段-1】测试代币信息查询（符号映射）")
-        print("=" * 80)
+        lines = ["", "=" * 80, "【第一阶段-1】测试代币信息查询（符号映射）", "=" * 80]
 
         # 调用API
         token_list = await binance_client.get_token_info()
@@ -91,14 +109,16 @@ class TestBinanceAPI:
         assert isinstance(token_list, list), "应该返回列表"
         assert len(token_list) > 0, "代币列表不应为空"
 
-        print(f"\n[OK] 成功获取 {len(token_list)} 个代币信息")
+        lines.append(f"\n[OK] 成功获取 {len(token_list)} 个代币信息")
 
         # 检查第一个代币的字段
         first_token = token_list[0]
-        print("\n示例代币信息:")
-        print(f"  symbol: {first_token.get('symbol')}")
-        print(f"  price: {first_token.get('price')}")
-        print(f"  volume: {first_token.get('volume')}")
+        lines += [
+            "\n示例代币信息:",
+            f"  symbol: {first_token.get('symbol')}",
+            f"  price: {first_token.get('price')}",
+            f"  volume: {first_token.get('volume')}",
+        ]
 
         # 验证必要字段
         assert "symbol" in first_token, "代币应包含symbol字段"
@@ -106,9 +126,9 @@ class TestBinanceAPI:
 
         # 保存一些代币符号供后续测试使用
         self.test_symbols = [t.get("symbol") for t in token_list[:3] if t.get("symbol")]
-        print(f"\n保存测试符号: {self.test_symbols}")
+        lines.append(f"\n保存测试符号: {self.test_symbols}")
+        _report(lines)
 
-    @pytest.mark.asyncio
     async def test_2_get_exchange_info(self, binance_client):
         """测试获取交易精度信息
 
@@ -117,9 +137,7 @@ class TestBinanceAPI:
         - 返回精度配置信息
         - 包含交易对精度（tradeDecimal, tokenDecimal）
         """
-        print("\n" + "=" * 80)
-        print("【第一阶段-2】测试交易精度信息查询")
-        print("=" * 80)
+        lines = ["", "=" * 80, "【第一阶段-2】测试交易精度信息查询", "=" * 80]
 
         # 调用API
         exchange_info = await binance_client.get_exchange_info()
@@ -128,22 +146,26 @@ class TestBinanceAPI:
         assert isinstance(exchange_info, dict), "应该返回字典"
         assert "symbols" in exchange_info or len(exchange_info) > 0, "应包含交易对信息"
 
-        print("\n[OK] 成功获取交易精度信息")
-        print(f"数据结构: {list(exchange_info.keys())[:5]}")
+        lines += [
+            "\n[OK] 成功获取交易精度信息",
+            f"数据结构: {list(exchange_info.keys())[:5]}",
+        ]
 
         # 如果有symbols字段，检查第一个交易对
         if "symbols" in exchange_info and len(exchange_info["symbols"]) > 0:
             first_symbol = exchange_info["symbols"][0]
-            print("\n示例交易对精度:")
-            print(f"  symbol: {first_symbol.get('symbol')}")
-            print(f"  tradeDecimal: {first_symbol.get('tradeDecimal')}")
-            print(f"  tokenDecimal: {first_symbol.get('tokenDecimal')}")
+            lines += [
+                "\n示例交易对精度:",
+                f"  symbol: {first_symbol.get('symbol')}",
+                f"  tradeDecimal: {first_symbol.get('tradeDecimal')}",
+                f"  tokenDecimal: {first_symbol.get('tokenDecimal')}",
+            ]
+        _report(lines)
 
     # ========================================================================
     # 第二阶段：用户数据查询测试
     # ========================================================================
 
-    @pytest.mark.asyncio
     async def test_3_get_wallet_balance(self, binance_client):
         """测试获取钱包余额
 
@@ -152,9 +174,7 @@ class TestBinanceAPI:
         - 返回余额数据
         - 包含总估值和代币列表
         """
-        print("\n" + "=" * 80)
-        print("【第二阶段-1】测试钱包余额查询")
-        print("=" * 80)
+        lines = ["", "=" * 80, "【第二阶段-1】测试钱包余额查询", "=" * 80]
 
         # 调用API
         balance_data = await binance_client.get_wallet_balance()
@@ -167,20 +187,22 @@ class TestBinanceAPI:
         total_value = balance_data.get("totalValuation", "0")
         balance_list = balance_data.get("list", [])
 
-        print(f"\n[OK] 总估值: {total_value} USDT")
-        print(f"[OK] 代币数量: {len(balance_list)}")
+        lines += [
+            f"\n[OK] 总估值: {total_value} USDT",
+            f"[OK] 代币数量: {len(balance_list)}",
+        ]
 
         # 显示前3个代币余额
         if balance_list:
-            print("\n代币余额详情（前3个）:")
-            for token in balance_list[:3]:
-                print(
-                    f"  {token.get('symbol'):10} | "
-                    f"可用: {token.get('free'):15} | "
-                    f"估值: {token.get('valuation'):10} USDT"
-                )
-
-    @pytest.mark.asyncio
+            lines.append("\n代币余额详情（前3个）:")
+            lines += [
+                f"  {token.get('symbol'):10} | "
+                f"可用: {token.get('free'):15} | "
+                f"估值: {token.get('valuation'):10} USDT"
+                for token in balance_list[:3]
+            ]
+        _report(lines)
+
     async def test_4_get_user_volume(self, binance_client):
         """测试获取用户今日交易量
 
@@ -189,9 +211,7 @@ class TestBinanceAPI:
         - 返回交易量数据
         - 包含总交易量和分代币交易量
         """
-        print("\n" + "=" * 80)
-        print("【第二阶段-2】测试用户交易量查询")
-        print("=" * 80)
+        lines = ["", "=" * 80, "【第二阶段-2】测试用户交易量查询", "=" * 80]
 
         # 调用API
         volume_data = await binance_client.get_user_volume()
@@ -202,22 +222,24 @@ class TestBinanceAPI:
         total_volume = volume_data.get("totalVolume", 0)
         volume_list = volume_data.get("tradeVolumeInfoList", [])
 
-        print(f"\n[OK] 今日总交易量: {total_volume} USDT")
-        print(f"[OK] 交易代币数量: {len(volume_list)}")
+        lines += [
+            f"\n[OK] 今日总交易量: {total_volume} USDT",
+            f"[OK] 交易代币数量: {len(volume_list)}",
+        ]
 
         # 显示各代币交易量
         if volume_list:
-            print("\n各代币交易量:")
-            for token_vol in volume_list:
-                print(
-                    f"  {token_vol.get('tokenName'):10} : {token_vol.get('volume'):15} USDT"
-                )
+            lines.append("\n各代币交易量:")
+            lines += [
+                f"  {token_vol.get('tokenName'):10} : {token_vol.get('volume'):15} USDT"
+                for token_vol in volume_list
+            ]
+        _report(lines)
 
     # ========================================================================
     # 第三阶段：订单查询测试
     # ========================================================================
 
-    @pytest.mark.asyncio
     async def test_5_get_open_orders(self, binance_client):
         """测试获取挂起订单
 
@@ -225,9 +247,7 @@ class TestBinanceAPI:
         - API调用成功
         - 返回订单列表（可能为空）
         """
-        print("\n" + "=" * 80)
-        print("【第三阶段】测试挂起订单查询")
-        print("=" * 80)
+        lines = ["", "=" * 80, "【第三阶段】测试挂起订单查询", "=" * 80]
 
         # 调用API
         open_orders = await binance_client.get_open_orders()
@@ -235,27 +255,29 @@ class TestBinanceAPI:
         # 验证返回数据
         assert isinstance(open_orders, list), "应该返回列表"
 
-        print(f"\n[OK] 当前挂起订单数量: {len(open_orders)}")
+        lines.append(f"\n[OK] 当前挂起订单数量: {len(open_orders)}")
 
         # 如果有挂起订单，显示详情
         if open_orders:
-            print("\n挂起订单详情:")
+            lines.append("\n挂起订单详情:")
             for order in open_orders[:3]:  # 显示前3个
-                print(f"  订单ID: {order.get('orderId')}")
-                print(f"    代币: {order.get('symbol')}")
-                print(f"    方向: {order.get('side')}")
-                print(f"    价格: {order.get('price')}")
-                print(f"    数量: {order.get('quantity')}")
-                print(f"    状态: {order.get('status')}")
-                print()
+                lines += [
+                    f"  订单ID: {order.get('orderId')}",
+                    f"    代币: {order.get('symbol')}",
+                    f"    方向: {order.get('side')}",
+                    f"    价格: {order.get('price')}",
+                    f"    数量: {order.get('quantity')}",
+                    f"    状态: {order.get('status')}",
+                    "",
+                ]
         else:
-            print("  (当前没有挂起订单)")
+            lines.append("  (当前没有挂起订单)")
+        _report(lines)
 
     # ========================================================================
     # 综合测试：验证数据一致性
     # ========================================================================
 
-    @pytest.mark.asyncio
     async def test_6_data_consistency(self, binance_client):
         """综合测试：验证不同API返回数据的一致性
 
@@ -263,31 +285,35 @@ class TestBinanceAPI:
         - 代币信息中的符号与余额中的符号可以对应
         - 精度信息可以用于价格和数量格式化
         """
-        print("\n" + "=" * 80)
-        print("【综合测试】验证API数据一致性")
-        print("=" * 80)
+        lines = ["", "=" * 80, "【综合测试】验证API数据一致性", "=" * 80]
 
-        # 获取各类数据
-        token_info = await binance_client.get_token_info()
-        _exchange_info = await binance_client.get_exchange_info()
-        balance_data = await binance_client.get_wallet_balance()
+        # 获取各类数据（三个请求互不依赖，并发发送）
+        token_info, _exchange_info, balance_data = await asyncio.gather(
+            binance_client.get_token_info(),
+            binance_client.get_exchange_info(),
+            binance_client.get_wallet_balance(),
+        )
 
         # 提取符号集合
-        token_symbols = {t.get("symbol") for t in token_info if t.get("symbol")}
-        balance_symbols = {
-            b.get("symbol") for b in balance_data.get("list", []) if b.get("symbol")
-        }
+        balance_list = balance_data.get("list", [])
+        token_symbols = set(filter(None, map(dict.get, token_info, repeat("symbol"))))
+        balance_symbols = set(
+            filter(None, map(dict.get, balance_list, repeat("symbol")))
+        )
 
-        print(f"\n[OK] 代币信息中的符号数量: {len(token_symbols)}")
-        print(f"[OK] 余额中的符号数量: {len(balance_symbols)}")
+        lines += [
+            f"\n[OK] 代币信息中的符号数量: {len(token_symbols)}",
+            f"[OK] 余额中的符号数量: {len(balance_symbols)}",
+        ]
 
         # 检查余额中的代币是否都在代币信息中
         if balance_symbols:
             common_symbols = token_symbols.intersection(balance_symbols)
-            print(f"[OK] 共同符号数量: {len(common_symbols)}")
+            lines.append(f"[OK] 共同符号数量: {len(common_symbols)}")
 
             if common_symbols:
-                print(f"\n示例共同符号: {list(common_symbols)[:5]}")
+                lines.append(f"\n示例共同符号: {list(common_symbols)[:5]}")
+        _report(lines)
 
 
 if __name__ == "__main__":
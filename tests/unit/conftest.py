@@ -0,0 +1,44 @@
+"""单元测试公共fixture"""
+
+from collections.abc import AsyncIterator, Callable, Iterator
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from binance.config.constants import BINANCE_API_BASE_URL
+from binance.infrastructure.binance_client.circuit_breaker import (
+    reset_circuit_breakers,
+)
+from binance.infrastructure.binance_client.http_client import BinanceClient
+
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+@pytest.fixture(autouse=True)
+def _reset_circuit_breakers() -> Iterator[None]:
+    """熔断状态按主机全局共享，每个用例前后清空，避免用例间互相影响"""
+    reset_circuit_breakers()
+    yield
+    reset_circuit_breakers()
+
+
+@pytest_asyncio.fixture
+async def make_client() -> AsyncIterator[Callable[[Handler], BinanceClient]]:
+    """创建使用 httpx.MockTransport 的 BinanceClient（不发送真实网络请求）"""
+    clients: list[BinanceClient] = []
+
+    def _make(handler: Handler) -> BinanceClient:
+        client = BinanceClient(headers={})
+        client._client = httpx.AsyncClient(
+            base_url=BINANCE_API_BASE_URL,
+            transport=httpx.MockTransport(handler),
+        )
+        clients.append(client)
+        return client
+
+    yield _make
+
+    for client in clients:
+        await client.close()
@@ -0,0 +1,182 @@
+"""熔断器单元测试"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from binance.config.constants import (
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
+)
+from binance.infrastructure.binance_client import circuit_breaker, http_client
+from binance.infrastructure.binance_client.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
+
+
+pytestmark = pytest.mark.unit
+
+VOLUME_PATH = "/bapi/defi/v1/private/wallet-direct/buw/wallet/today/user-volume"
+
+
+class FakeClock:
+    """可手动推进的 time.monotonic 替身"""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", fake)
+    return fake
+
+
+def _open(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+
+def test_opens_after_failure_threshold(clock: FakeClock) -> None:
+    breaker = CircuitBreaker("api.test")
+
+    for _ in range(CIRCUIT_BREAKER_FAILURE_THRESHOLD - 1):
+        breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.check()
+    assert exc_info.value.retry_after == pytest.approx(CIRCUIT_BREAKER_RECOVERY_TIMEOUT)
+
+
+def test_success_resets_failure_count(clock: FakeClock) -> None:
+    breaker = CircuitBreaker("api.test")
+
+    for _ in range(CIRCUIT_BREAKER_FAILURE_THRESHOLD - 1):
+        breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_half_open_after_recovery_timeout_admits_single_probe(
+    clock: FakeClock,
+) -> None:
+    breaker = CircuitBreaker("api.test")
+    _open(breaker)
+
+    clock.now += CIRCUIT_BREAKER_RECOVERY_TIMEOUT - 0.1
+    assert not breaker.allow()
+
+    clock.now += 0.1
+    assert breaker.check() is True
+    assert breaker.state == CircuitState.HALF_OPEN
+    # 试探请求未返回前，其他请求被拒绝
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+
+def test_half_open_failure_reopens(clock: FakeClock) -> None:
+    breaker = CircuitBreaker("api.test")
+    _open(breaker)
+    clock.now += CIRCUIT_BREAKER_RECOVERY_TIMEOUT
+
+    assert breaker.check()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow()
+
+
+def test_half_open_success_closes(clock: FakeClock) -> None:
+    breaker = CircuitBreaker("api.test")
+    _open(breaker)
+    clock.now += CIRCUIT_BREAKER_RECOVERY_TIMEOUT
+
+    assert breaker.check()
+    breaker.record_success()
+
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.failure_count == 0
+    assert breaker.check() is False
+    assert breaker.check() is False
+
+
+def test_released_probe_admits_next_caller(clock: FakeClock) -> None:
+    breaker = CircuitBreaker("api.test")
+    _open(breaker)
+    clock.now += CIRCUIT_BREAKER_RECOVERY_TIMEOUT
+
+    assert breaker.check()
+    breaker.release_probe()
+
+    assert breaker.check()
+
+
+def test_get_circuit_breaker_shares_state_per_host() -> None:
+    breaker = circuit_breaker.get_circuit_breaker("api.test")
+
+    assert circuit_breaker.get_circuit_breaker("api.test") is breaker
+    assert circuit_breaker.get_circuit_breaker("other.test") is not breaker
+
+    circuit_breaker.reset_circuit_breakers()
+    assert circuit_breaker.get_circuit_breaker("api.test") is not breaker
+
+
+@pytest.mark.asyncio
+async def test_make_request_circuit_opens_after_threshold(
+    make_client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(http_client, "_retry_delay", lambda _attempt: 0)
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(503)
+
+    client = make_client(handler)
+
+    # 每次调用重试用尽后计一次失败
+    for _ in range(CIRCUIT_BREAKER_FAILURE_THRESHOLD):
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_user_volume()
+    calls_before_open = calls
+
+    # 熔断后快速失败，不再发出请求
+    with pytest.raises(CircuitOpenError):
+        await client.get_user_volume()
+    assert calls == calls_before_open
+
+
+@pytest.mark.asyncio
+async def test_deadline_expiry_opens_circuit(
+    make_client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(http_client, "_retry_delay", lambda _attempt: 0)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.03)
+        raise httpx.ConnectTimeout("timeout", request=request)
+
+    client = make_client(handler)
+
+    # 总时限在重试途中到期，重试循环被取消，每次调用仍计一次失败
+    for _ in range(CIRCUIT_BREAKER_FAILURE_THRESHOLD):
+        with pytest.raises(httpx.TimeoutException):
+            await client._request("GET", VOLUME_PATH, deadline=0.05)
+
+    assert client._breaker.state == CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        await client.get_user_volume()
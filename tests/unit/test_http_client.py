@@ -0,0 +1,212 @@
+"""BinanceClient 单元测试（使用 httpx.MockTransport，不访问网络）"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from binance.config.constants import (
+    MAX_RETRY_ATTEMPTS,
+    RETRY_DELAY_BASE,
+    RETRY_DELAY_MAX,
+)
+from binance.infrastructure.binance_client import http_client
+
+
+pytestmark = pytest.mark.unit
+
+VOLUME_PATH = "/bapi/defi/v1/private/wallet-direct/buw/wallet/today/user-volume"
+
+
+def _ok(data: object = None) -> httpx.Response:
+    """构造业务成功的API响应"""
+    return httpx.Response(200, json={"success": True, "data": data})
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """记录重试等待时间，不实际等待"""
+    recorded: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        recorded.append(delay)
+
+    monkeypatch.setattr(http_client.asyncio, "sleep", fake_sleep)
+    return recorded
+
+
+@pytest.mark.asyncio
+async def test_get_retries_transient_status_then_succeeds(
+    make_client, sleeps: list[float]
+) -> None:
+    statuses = iter([503, 503])
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        status = next(statuses, None)
+        return httpx.Response(status) if status else _ok({"totalVolume": 1})
+
+    client = make_client(handler)
+
+    assert await client.get_user_volume() == {"totalVolume": 1}
+    assert calls == 3
+    assert len(sleeps) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_does_not_retry_client_error(
+    make_client, sleeps: list[float]
+) -> None:
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(401)
+
+    client = make_client(handler)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.get_user_volume()
+    assert calls == 1
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_post_is_never_retried(make_client, sleeps: list[float]) -> None:
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(503)
+
+    client = make_client(handler)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client._request("POST", VOLUME_PATH, json={})
+    assert calls == 1
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_backoff_sequence_stays_within_bounds(
+    make_client, sleeps: list[float]
+) -> None:
+    client = make_client(lambda _request: httpx.Response(503))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.get_user_volume()
+
+    assert len(sleeps) == MAX_RETRY_ATTEMPTS
+    for attempt, delay in enumerate(sleeps):
+        assert 0 <= delay <= min(RETRY_DELAY_MAX, RETRY_DELAY_BASE * 2**attempt)
+
+
+def test_retry_delay_is_capped() -> None:
+    for attempt in range(12):
+        cap = min(RETRY_DELAY_MAX, RETRY_DELAY_BASE * 2**attempt)
+        for _ in range(50):
+            assert 0 <= http_client._retry_delay(attempt) <= cap
+
+
+@pytest.mark.asyncio
+async def test_deadline_expiry_raises_timeout_exception(make_client) -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(1)
+        return _ok()
+
+    client = make_client(handler)
+
+    with pytest.raises(httpx.TimeoutException):
+        await client._request("GET", VOLUME_PATH, deadline=0.05)
+
+
+class InflightProbe:
+    """记录同时在途请求数峰值的异步handler"""
+
+    def __init__(self) -> None:
+        self.current = 0
+        self.peak = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.current += 1
+        self.peak = max(self.peak, self.current)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.current -= 1
+        return _ok({"totalVolume": 1})
+
+
+@pytest.mark.asyncio
+async def test_bulkhead_caps_concurrent_requests(
+    make_client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(http_client, "HTTP_MAX_INFLIGHT_PER_HOST", 3)
+    probe = InflightProbe()
+    # 并发上限按主机共享，跨客户端实例生效
+    clients = [make_client(probe) for _ in range(4)]
+
+    await asyncio.gather(
+        *(client.get_user_volume() for client in clients for _ in range(5))
+    )
+
+    assert probe.peak == 3
+
+
+def test_bulkhead_is_per_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(http_client, "HTTP_MAX_INFLIGHT_PER_HOST", 2)
+    probe = InflightProbe()
+
+    async def burst() -> None:
+        client = http_client.BinanceClient(headers={})
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(probe))
+        try:
+            await asyncio.gather(*(client.get_user_volume() for _ in range(10)))
+        finally:
+            await client.close()
+
+    # 信号量在第一个事件循环中发生过等待，第二个事件循环不能复用它
+    asyncio.run(burst())
+    asyncio.run(burst())
+
+    assert probe.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_gather_parallelism(make_client) -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.1)
+        return _ok(request.url.params["i"])
+
+    client = make_client(handler)
+    specs = [("GET", VOLUME_PATH, {"params": {"i": str(i)}}) for i in range(5)]
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    results = await client.gather(specs)
+    elapsed = loop.time() - started
+
+    # 结果按输入顺序返回；并发发送时总耗时接近单个请求而非5倍
+    assert [result["data"] for result in results] == ["0", "1", "2", "3", "4"]
+    assert elapsed < 0.3
+
+
+@pytest.mark.asyncio
+async def test_gather_return_exceptions(make_client) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params["i"] == "1":
+            return httpx.Response(401)
+        return _ok(request.url.params["i"])
+
+    client = make_client(handler)
+    specs = [("GET", VOLUME_PATH, {"params": {"i": str(i)}}) for i in range(3)]
+
+    results = await client.gather(specs, return_exceptions=True)
+
+    assert results[0]["data"] == "0"
+    assert isinstance(results[1], httpx.HTTPStatusError)
+    assert results[2]["data"] == "2"
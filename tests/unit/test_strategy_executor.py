@@ -0,0 +1,107 @@
+"""StrategyExecutor 并发控制单元测试"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from binance.application.services.strategy_executor import StrategyExecutor
+from binance.infrastructure.config.strategy_config_manager import StrategyConfig
+
+
+pytestmark = [pytest.mark.unit, pytest.mark.asyncio]
+
+MAX_CONCURRENT_USERS = 2
+
+CONFIG_YAML = f"""
+global_settings:
+  max_concurrent_users: {MAX_CONCURRENT_USERS}
+
+strategies:
+  - strategy_id: "test"
+    strategy_name: "测试策略"
+    enabled: true
+    target_token: TEST
+    target_chain: BSC
+    target_volume: 100
+    user_ids: [1, 2, 3, 4, 5, 6]
+"""
+
+
+@pytest.fixture
+def executor(tmp_path: Path) -> StrategyExecutor:
+    config_path = tmp_path / "trading_config.yaml"
+    config_path.write_text(CONFIG_YAML, encoding="utf-8")
+    return StrategyExecutor(config_path=str(config_path))
+
+
+class ConcurrencyProbe:
+    """替代 _run_user_strategy，记录同时运行的用户数峰值"""
+
+    def __init__(self) -> None:
+        self.current = 0
+        self.peak = 0
+        self.started: list[int] = []
+        self.release = asyncio.Event()
+
+    async def __call__(self, user_id: int, strategy: StrategyConfig) -> None:
+        self.started.append(user_id)
+        self.current += 1
+        self.peak = max(self.peak, self.current)
+        try:
+            await self.release.wait()
+        finally:
+            self.current -= 1
+
+
+async def test_user_strategies_capped_by_max_concurrent_users(
+    executor: StrategyExecutor, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    probe = ConcurrencyProbe()
+    monkeypatch.setattr(executor, "_run_user_strategy", probe)
+    strategy = executor.config_manager.get_strategy("test")
+
+    run = asyncio.create_task(executor._run_strategy(strategy))
+    await asyncio.sleep(0.01)
+    assert probe.current == MAX_CONCURRENT_USERS
+
+    probe.release.set()
+    await run
+
+    assert probe.peak <= MAX_CONCURRENT_USERS
+    assert sorted(probe.started) == strategy.user_ids
+
+
+async def test_queued_users_skip_after_stop(
+    executor: StrategyExecutor, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    probe = ConcurrencyProbe()
+    monkeypatch.setattr(executor, "_run_user_strategy", probe)
+    strategy = executor.config_manager.get_strategy("test")
+
+    run = asyncio.create_task(executor._run_strategy(strategy))
+    await asyncio.sleep(0.01)
+
+    # 停止策略后释放名额，排队中的用户不应再开始执行
+    executor._stop_flags[strategy.strategy_id] = True
+    probe.release.set()
+    await run
+
+    assert len(probe.started) == MAX_CONCURRENT_USERS
+
+
+@pytest.mark.parametrize("value", [0, -1])
+async def test_invalid_max_concurrent_users_rejected(
+    tmp_path: Path, value: int
+) -> None:
+    config_path = tmp_path / "trading_config.yaml"
+    config_path.write_text(
+        CONFIG_YAML.replace(
+            f"max_concurrent_users: {MAX_CONCURRENT_USERS}",
+            f"max_concurrent_users: {value}",
+        ),
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ValueError, match="max_concurrent_users"):
+        StrategyExecutor(config_path=str(config_path))